@@ -4,25 +4,335 @@ Hosted on Render.com
 """
 
 from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+from flask_caching import Cache
 from flask_cors import CORS
+import concurrent.futures
+import hashlib
+import msgspec
+import orjson
+import functools
+import re
+import socket
+import ssl
+from bisect import bisect_right
+from types import MappingProxyType
+from urllib.parse import quote_plus
+import threading
+import time
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+class _ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson's C-level encoder/decoder"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = _ORJSONProvider(app)
 CORS(app)  # Enable CORS for frontend communication
 
+# Weather for a given city changes slowly, so identical location+preference
+# requests within a short window can share one response and skip all the
+# upstream round-trips entirely
+cache = Cache(app, config={'CACHE_TYPE': 'SimpleCache',
+                           'CACHE_DEFAULT_TIMEOUT': 300})
+
+
+def _request_body_key():
+    """Cache key for POST endpoints: a digest of the raw request body"""
+    return hashlib.blake2b(request.get_data()).hexdigest()
+
 # Configuration
 OPENWEATHER_API_KEY = os.getenv('OPENWEATHER_API_KEY')
 OPENWEATHER_BASE_URL = 'https://api.openweathermap.org/data/2.5/weather'
 UNSPLASH_ACCESS_KEY = os.getenv('UNSPLASH_ACCESS_KEY')
 UNSPLASH_BASE_URL = 'https://api.unsplash.com/search/photos'
+# Constant Unsplash search parameters, encoded once; only the dynamic
+# query term needs quoting per call
+_UNSPLASH_STATIC_QS = '&per_page=1&orientation=portrait&content_filter=high'
+
+
+# TCP keepalive probes on pooled sockets, so upstream connections that die
+# while a Render worker sits idle are evicted before a real request hits them
+_SOCKET_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+if hasattr(socket, 'TCP_KEEPIDLE'):  # Linux only
+    _SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30))
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled sockets run TCP keepalive probes"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = _SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+# Cache getaddrinfo results for a few minutes so the first connection after
+# an idle period doesn't pay a DNS lookup on top of the TLS handshake
+_DNS_CACHE_TTL = 300
+_DNS_CACHE_MAX = 64
+_dns_cache = {}
+_dns_cache_lock = threading.Lock()
+_system_getaddrinfo = socket.getaddrinfo
+
+
+def _cached_getaddrinfo(host, port, *args, **kwargs):
+    key = (host, port, args, tuple(sorted(kwargs.items())))
+    with _dns_cache_lock:
+        entry = _dns_cache.get(key)
+        if entry is not None and entry[0] > time.time():
+            return entry[1]
+    result = _system_getaddrinfo(host, port, *args, **kwargs)
+    with _dns_cache_lock:
+        if len(_dns_cache) >= _DNS_CACHE_MAX:
+            _dns_cache.clear()
+        _dns_cache[key] = (time.time() + _DNS_CACHE_TTL, result)
+    return result
+
+
+socket.getaddrinfo = _cached_getaddrinfo
+
+
+def _make_session():
+    """Create a session with connection pooling and retries for upstream APIs"""
+    session = requests.Session()
+    adapter = _KeepAliveAdapter(
+        pool_connections=2,
+        pool_maxsize=32,
+        pool_block=False,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+    )
+    session.mount('https://', adapter)
+    return session
+
+
+# Building the default SSL context is expensive and otherwise happens
+# implicitly inside each new connection pool; do it once at import
+_SSL_CONTEXT = ssl.create_default_context()
+
+# Shared clients so repeated calls reuse keep-alive connections instead of
+# paying a fresh TCP + TLS handshake per request. Unsplash gets up to 5
+# concurrent searches per user request, so it uses an HTTP/2 client that
+# multiplexes them over a single connection rather than opening one socket
+# per worker thread
+_weather_session = _make_session()
+_unsplash_client = httpx.Client(
+    headers={'Authorization': f'Client-ID {UNSPLASH_ACCESS_KEY}'},
+    timeout=5.0,
+    transport=httpx.HTTPTransport(
+        retries=2,
+        http2=True,
+        verify=_SSL_CONTEXT,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=8,
+                            keepalive_expiry=30.0),
+        socket_options=_SOCKET_OPTIONS
+    )
+)
+
+def _warm_upstream_connections():
+    """
+    Open the upstream TLS connections proactively so the first real request
+    after a worker boots doesn't pay DNS + handshake for both hosts
+    """
+    for client, url in ((_weather_session, OPENWEATHER_BASE_URL),
+                        (_unsplash_client, 'https://api.unsplash.com')):
+        try:
+            client.head(url, timeout=2)
+        except Exception:
+            # Best effort; a failure just means the first request pays
+            # the handshake as before
+            pass
+
+
+# Flask 2.3 dropped before_first_request, so warm at import time, which
+# runs once per gunicorn worker boot
+_warm_upstream_connections()
+
+
+# Unsplash query templates per outfit piece; only the dynamic piece name is
+# formatted per call. Read-only so requests share a single dict
+_QUERY_TEMPLATES = MappingProxyType({
+    'top': '{} fashion flatlay',
+    'bottom': '{} fashion flatlay',
+    'outerwear': '{} fashion flatlay',
+    'footwear': '{} fashion flatlay'
+})
+
+# The generic outfit image is the same for every request and does not depend
+# on the weather, so its lookup can overlap the OpenWeather round-trip
+_COMPLETE_OUTFIT_QUERY = 'complete outfit flatlay fashion minimal aesthetic'
+
+# One executor for all Unsplash lookups, shared across requests for the
+# lifetime of the process; spawning a fresh pool per request would pay
+# thread startup/teardown on every call, which dominates once the searches
+# themselves are cache hits. Sized for the gunicorn worker's thread count
+# (16, see Procfile) times the per-request search fan-out (4 pieces plus
+# the speculative complete-outfit lookup) so a fully loaded worker never
+# queues searches behind the pool.
+_image_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=80, thread_name_prefix='unsplash')
+
+# The outfit pieces come from a small fixed vocabulary, so the same ~30
+# Unsplash queries repeat across users; cache results for an hour to turn
+# the common case into a dict lookup instead of a network call
+_UNSPLASH_CACHE_TTL = 3600
+_UNSPLASH_CACHE_MAX = 512
+_CACHE_MISS = object()
+_unsplash_cache = {}
+_unsplash_cache_lock = threading.Lock()
+
+
+def _unsplash_cache_get(query):
+    """Return the cached result for a query, or _CACHE_MISS if absent/expired"""
+    with _unsplash_cache_lock:
+        entry = _unsplash_cache.get(query)
+        if entry is not None:
+            if entry[0] > time.time():
+                return entry[1]
+            del _unsplash_cache[query]
+    return _CACHE_MISS
+
+
+def _unsplash_cache_put(query, value):
+    """Store a query result (including None for empty searches) with a TTL"""
+    with _unsplash_cache_lock:
+        if len(_unsplash_cache) >= _UNSPLASH_CACHE_MAX:
+            now = time.time()
+            expired = [key for key, (expiry, _) in _unsplash_cache.items()
+                       if expiry <= now]
+            for key in expired:
+                del _unsplash_cache[key]
+            if len(_unsplash_cache) >= _UNSPLASH_CACHE_MAX:
+                _unsplash_cache.pop(next(iter(_unsplash_cache)))
+        _unsplash_cache[query] = (time.time() + _UNSPLASH_CACHE_TTL, value)
 
 
 # Outfit recommendation logic
+#
+# Prebuilt outfit templates, one per temperature band; accessories are
+# tuples so the shared templates can never be mutated by a request
+_TEMP_THRESHOLDS = (50, 65, 75, 85)
+_TEMP_OUTFITS = (
+    {  # Cold
+        'top': 'Thermal long-sleeve shirt or sweater',
+        'bottom': 'Jeans or warm pants',
+        'outerwear': 'Heavy coat or parka',
+        'footwear': 'Boots',
+        'accessories': ('Scarf', 'Gloves', 'Beanie')
+    },
+    {  # Cool
+        'top': 'Long-sleeve shirt or light sweater',
+        'bottom': 'Chinos or jeans',
+        'outerwear': 'Light jacket or cardigan',
+        'footwear': 'Sneakers or loafers',
+        'accessories': ('Light scarf',)
+    },
+    {  # Mild
+        'top': 'T-shirt or button-down shirt',
+        'bottom': 'Chinos or casual pants',
+        'outerwear': 'Optional light jacket',
+        'footwear': 'Sneakers or casual shoes',
+        'accessories': ('Sunglasses',)
+    },
+    {  # Warm
+        'top': 'Breathable t-shirt or polo',
+        'bottom': 'Shorts or light pants',
+        'outerwear': 'None needed',
+        'footwear': 'Sandals or canvas shoes',
+        'accessories': ('Sunglasses', 'Hat')
+    },
+    {  # Hot
+        'top': 'Light, breathable tank or t-shirt',
+        'bottom': 'Shorts',
+        'outerwear': 'None',
+        'footwear': 'Sandals',
+        'accessories': ('Sunglasses', 'Sun hat', 'Sunscreen')
+    }
+)
+
+_COLOR_PALETTES = MappingProxyType({
+    'neutral': ('Navy', 'Beige', 'White', 'Gray'),
+    'warm': ('Burgundy', 'Mustard', 'Rust', 'Cream'),
+    'cool': ('Navy', 'Teal', 'Silver', 'Ice Blue'),
+    'vibrant': ('Red', 'Emerald', 'Royal Blue', 'Yellow')
+})
+
+# Weather condition adjustments applied on top of the temperature template
+_RAIN_PATCH = {
+    'outerwear': 'Waterproof jacket or raincoat',
+    'footwear': 'Waterproof boots or shoes',
+    'add_accessories': ('Umbrella',)
+}
+_CONDITION_PATCHES = {
+    'Rain': _RAIN_PATCH,
+    'Drizzle': _RAIN_PATCH,
+    'Thunderstorm': _RAIN_PATCH,
+    'Snow': {
+        'outerwear': 'Insulated winter coat',
+        'footwear': 'Winter boots',
+        'add_accessories': ('Warm hat', 'Gloves', 'Scarf')
+    }
+}
+
+
+# The professional mood rewrites 't-shirt'/'T-shirt' in the top; a single
+# precompiled substitution scans the string once instead of twice
+_TSHIRT_RE = re.compile(r'(T|t)-shirt')
+
+
+def _tshirt_sub(match):
+    return 'Button-down shirt' if match.group(1) == 'T' else 'dress shirt'
+
+
+# Mood adjustments, dispatched by dict lookup instead of an if/elif chain
+def _apply_professional(outfit):
+    outfit['top'] = _TSHIRT_RE.sub(_tshirt_sub, outfit['top'])
+    outfit['bottom'] = 'Dress pants or skirt'
+    outfit['footwear'] = 'Dress shoes or heels'
+
+
+def _apply_adventurous(outfit):
+    outfit['footwear'] = 'Hiking boots or athletic shoes'
+    outfit['accessories'].append('Backpack')
+
+
+def _apply_cozy(outfit):
+    outfit['top'] = 'Soft sweater or hoodie'
+    outfit['accessories'].append('Comfort scarf')
+
+
+_MOOD_HANDLERS = {
+    'professional': _apply_professional,
+    'adventurous': _apply_adventurous,
+    'cozy': _apply_cozy
+}
+
+_RAINY_CONDITIONS = frozenset({'Rain', 'Drizzle'})
+
+
+def _temp_bucket(temp):
+    """Quantize a temperature into the 5 bands the recommendations use"""
+    # bisect_right keeps boundary temps in the same band as the old < ladder
+    return bisect_right(_TEMP_THRESHOLDS, temp)
+
+
 def get_outfit_recommendation(weather_data, preferences):
     """
     Generate outfit recommendations based on weather and user preferences
@@ -32,166 +342,153 @@ def get_outfit_recommendation(weather_data, preferences):
     mood = preferences.get('mood', 'casual')
     style = preferences.get('style_preference', 'casual')
     color_pref = preferences.get('color_preference', 'neutral')
-    
-    # Initialize outfit components
-    outfit = {
-        'top': '',
-        'bottom': '',
-        'outerwear': '',
-        'footwear': '',
-        'accessories': []
+
+    (top, bottom, outerwear, footwear, accessories,
+     color_palette, style_tips) = _outfit_core(
+        _temp_bucket(temp), condition, mood, style, color_pref)
+
+    # The cached core returns immutable tuples; convert back to the
+    # mutable dict/list shape the JSON response uses
+    return {
+        'outfit': {
+            'top': top,
+            'bottom': bottom,
+            'outerwear': outerwear,
+            'footwear': footwear,
+            'accessories': list(accessories)
+        },
+        'color_palette': list(color_palette),
+        'style_tips': style_tips
     }
-    
-    # Temperature-based recommendations
-    if temp < 50:  # Cold
-        outfit['top'] = 'Thermal long-sleeve shirt or sweater'
-        outfit['bottom'] = 'Jeans or warm pants'
-        outfit['outerwear'] = 'Heavy coat or parka'
-        outfit['footwear'] = 'Boots'
-        outfit['accessories'] = ['Scarf', 'Gloves', 'Beanie']
-    elif temp < 65:  # Cool
-        outfit['top'] = 'Long-sleeve shirt or light sweater'
-        outfit['bottom'] = 'Chinos or jeans'
-        outfit['outerwear'] = 'Light jacket or cardigan'
-        outfit['footwear'] = 'Sneakers or loafers'
-        outfit['accessories'] = ['Light scarf']
-    elif temp < 75:  # Mild
-        outfit['top'] = 'T-shirt or button-down shirt'
-        outfit['bottom'] = 'Chinos or casual pants'
-        outfit['outerwear'] = 'Optional light jacket'
-        outfit['footwear'] = 'Sneakers or casual shoes'
-        outfit['accessories'] = ['Sunglasses']
-    elif temp < 85:  # Warm
-        outfit['top'] = 'Breathable t-shirt or polo'
-        outfit['bottom'] = 'Shorts or light pants'
-        outfit['outerwear'] = 'None needed'
-        outfit['footwear'] = 'Sandals or canvas shoes'
-        outfit['accessories'] = ['Sunglasses', 'Hat']
-    else:  # Hot
-        outfit['top'] = 'Light, breathable tank or t-shirt'
-        outfit['bottom'] = 'Shorts'
-        outfit['outerwear'] = 'None'
-        outfit['footwear'] = 'Sandals'
-        outfit['accessories'] = ['Sunglasses', 'Sun hat', 'Sunscreen']
-    
+
+
+@functools.lru_cache(maxsize=512)
+def _outfit_core(temp_bucket, condition, mood, style, color_pref):
+    """
+    Cached recommendation core. Deterministic in its arguments, and the
+    argument space is small (5 temp bands x a handful of conditions/moods),
+    so repeat requests become a dict lookup instead of re-running the
+    branching below. Returns only immutable values so cached entries can
+    never be mutated by callers.
+    """
+    # Temperature-based recommendations: copy the prebuilt template for
+    # this band, giving the copy its own mutable accessories list
+    template = _TEMP_OUTFITS[temp_bucket]
+    outfit = {**template, 'accessories': list(template['accessories'])}
+
     # Weather condition adjustments
-    if condition in ['Rain', 'Drizzle', 'Thunderstorm']:
-        outfit['outerwear'] = 'Waterproof jacket or raincoat'
-        outfit['accessories'].append('Umbrella')
-        outfit['footwear'] = 'Waterproof boots or shoes'
-    elif condition == 'Snow':
-        outfit['outerwear'] = 'Insulated winter coat'
-        outfit['accessories'].extend(['Warm hat', 'Gloves', 'Scarf'])
-        outfit['footwear'] = 'Winter boots'
-    
+    patch = _CONDITION_PATCHES.get(condition)
+    if patch is not None:
+        outfit['outerwear'] = patch['outerwear']
+        outfit['footwear'] = patch['footwear']
+        outfit['accessories'].extend(patch['add_accessories'])
+
     # Mood-based adjustments
-    if mood == 'professional':
-        outfit['top'] = outfit['top'].replace('t-shirt', 'dress shirt').replace('T-shirt', 'Button-down shirt')
-        outfit['bottom'] = 'Dress pants or skirt'
-        outfit['footwear'] = 'Dress shoes or heels'
-    elif mood == 'adventurous':
-        outfit['footwear'] = 'Hiking boots or athletic shoes'
-        outfit['accessories'].append('Backpack')
-    elif mood == 'cozy':
-        outfit['top'] = 'Soft sweater or hoodie'
-        outfit['accessories'].append('Comfort scarf')
-    
+    mood_handler = _MOOD_HANDLERS.get(mood)
+    if mood_handler is not None:
+        mood_handler(outfit)
+
     # Color palette based on preference
-    color_palettes = {
-        'neutral': ['Navy', 'Beige', 'White', 'Gray'],
-        'warm': ['Burgundy', 'Mustard', 'Rust', 'Cream'],
-        'cool': ['Navy', 'Teal', 'Silver', 'Ice Blue'],
-        'vibrant': ['Red', 'Emerald', 'Royal Blue', 'Yellow']
-    }
-    
-    color_palette = color_palettes.get(color_pref, color_palettes['neutral'])
-    
+    color_palette = _COLOR_PALETTES.get(color_pref, _COLOR_PALETTES['neutral'])
+
     # Style tips
-    style_tips = generate_style_tips(temp, condition, mood)
-    
-    return {
-        'outfit': outfit,
-        'color_palette': color_palette,
-        'style_tips': style_tips
-    }
+    style_tips = generate_style_tips(temp_bucket, condition, mood)
+
+    return (outfit['top'], outfit['bottom'], outfit['outerwear'],
+            outfit['footwear'], tuple(outfit['accessories']),
+            color_palette, style_tips)
 
 
-def generate_style_tips(temp, condition, mood):
+@functools.lru_cache(maxsize=256)
+def generate_style_tips(temp_bucket, condition, mood):
     """Generate helpful styling tips"""
     tips = []
-    
-    if temp < 65:
+
+    if temp_bucket < 2:
         tips.append("Layer your clothing for temperature flexibility")
-    
-    if condition in ['Rain', 'Drizzle']:
+
+    if condition in _RAINY_CONDITIONS:
         tips.append("Choose water-resistant fabrics")
-    
-    if temp > 75:
+
+    if temp_bucket > 2:
         tips.append("Opt for breathable, moisture-wicking materials")
-    
+
     if mood == 'professional':
         tips.append("Keep accessories minimal and polished")
-    
+
     return ' | '.join(tips) if tips else "Dress comfortably and confidently!"
 
 
-def search_unsplash_image(query, orientation='portrait'):
+def search_unsplash_image(query):
     """
     Search Unsplash for outfit-related images
     Returns image URL or None if not found
     """
     if not UNSPLASH_ACCESS_KEY:
         return None
-    
+
+    cached = _unsplash_cache_get(query)
+    if cached is not _CACHE_MISS:
+        return cached
+
     try:
-        params = {
-            'query': query,
-            'per_page': 1,
-            'orientation': orientation,
-            'content_filter': 'high'
-        }
-        headers = {
-            'Authorization': f'Client-ID {UNSPLASH_ACCESS_KEY}'
-        }
-        
-        response = requests.get(UNSPLASH_BASE_URL, params=params, headers=headers)
-        
+        url = f'{UNSPLASH_BASE_URL}?query={quote_plus(query)}{_UNSPLASH_STATIC_QS}'
+        response = _unsplash_client.get(url)
+
         if response.status_code == 200:
-            data = response.json()
+            # Unsplash responses carry dozens of fields per photo; orjson
+            # parses them at C level far faster than stdlib json
+            data = orjson.loads(response.content)
             if data['results']:
-                return {
+                image_data = {
                     'url': data['results'][0]['urls']['regular'],
                     'thumb': data['results'][0]['urls']['small'],
                     'photographer': data['results'][0]['user']['name'],
                     'photographer_url': data['results'][0]['user']['links']['html']
                 }
+            else:
+                # Empty searches are just as repeatable, cache those too
+                image_data = None
+            _unsplash_cache_put(query, image_data)
+            return image_data
         return None
     except Exception as e:
         print(f"Unsplash API error: {str(e)}")
         return None
 
 
-def get_outfit_images(outfit):
+def get_outfit_images(outfit, complete_image_future=None):
     """
     Fetch Unsplash images for each outfit component
     """
     images = {}
-    
-    # Search queries for each outfit piece
-    search_queries = {
-        'top': f"{outfit['top']} fashion flatlay",
-        'bottom': f"{outfit['bottom']} fashion flatlay",
-        'outerwear': f"{outfit['outerwear']} fashion flatlay" if outfit['outerwear'] and outfit['outerwear'] != 'None needed' else None,
-        'footwear': f"{outfit['footwear']} fashion flatlay",
-        'outfit_complete': f"complete outfit flatlay fashion minimal aesthetic"
+
+    # Search queries for each outfit piece; pieces the outfit marks as
+    # 'None'/'None needed' are dropped up front so no worker, request or
+    # JSON parse is spent on them
+    queries = {
+        key: _QUERY_TEMPLATES[key].format(value)
+        for key, value in outfit.items()
+        if key in _QUERY_TEMPLATES and value and value not in ('None', 'None needed')
     }
-    
-    for key, query in search_queries.items():
-        if query:
-            image_data = search_unsplash_image(query)
-            if image_data:
-                images[key] = image_data
-    
+    if complete_image_future is None:
+        queries['outfit_complete'] = _COMPLETE_OUTFIT_QUERY
+
+    # The searches are independent and network-bound, so run them concurrently
+    # on the shared executor; each worker multiplexes onto _unsplash_client's
+    # pooled connection
+    futures = {_image_executor.submit(search_unsplash_image, query): key
+               for key, query in queries.items()}
+    for future in concurrent.futures.as_completed(futures):
+        image_data = future.result()
+        if image_data:
+            images[futures[future]] = image_data
+
+    if complete_image_future is not None:
+        image_data = complete_image_future.result()
+        if image_data:
+            images['outfit_complete'] = image_data
+
     return images
 
 
@@ -204,27 +501,43 @@ def health_check():
     }), 200
 
 
+class OutfitRequest(msgspec.Struct):
+    """Inbound body for /api/outfit-recommendation; only location is required"""
+    location: str
+    mood: str = 'casual'
+    style_preference: str = 'casual'
+    color_preference: str = 'neutral'
+
+
 @app.route('/api/outfit-recommendation', methods=['POST'])
+@cache.cached(timeout=300, make_cache_key=_request_body_key,
+              response_filter=lambda rv: rv[1] == 200)
 def outfit_recommendation():
     """
     Main endpoint for outfit recommendations
     Expects JSON body with: location, mood, style_preference, color_preference
     """
     try:
-        # Parse request data
-        data = request.get_json()
-        
-        # Validate required fields
-        if not data or 'location' not in data:
+        # Parse and validate the request body in one C-level pass; missing
+        # location or malformed JSON both raise DecodeError
+        try:
+            req = msgspec.json.decode(request.get_data(), type=OutfitRequest)
+        except msgspec.DecodeError:
             return jsonify({
                 'error': 'Location is required'
             }), 400
-        
-        location = data['location']
+
+        location = req.location
+
+        # Start the weather-independent image lookup now so it runs while
+        # we wait on the OpenWeather response
+        complete_image_future = _image_executor.submit(
+            search_unsplash_image, _COMPLETE_OUTFIT_QUERY)
+
         preferences = {
-            'mood': data.get('mood', 'casual'),
-            'style_preference': data.get('style_preference', 'casual'),
-            'color_preference': data.get('color_preference', 'neutral')
+            'mood': req.mood,
+            'style_preference': req.style_preference,
+            'color_preference': req.color_preference
         }
         
         # Fetch weather data from OpenWeather API
@@ -234,41 +547,38 @@ def outfit_recommendation():
             'units': 'imperial'  # Use Fahrenheit
         }
         
-        weather_response = requests.get(OPENWEATHER_BASE_URL, params=weather_params)
+        weather_response = _weather_session.get(OPENWEATHER_BASE_URL, params=weather_params, timeout=5)
         
         if weather_response.status_code != 200:
             return jsonify({
                 'error': 'Unable to fetch weather data. Please check the location.'
             }), 400
         
-        weather_data = weather_response.json()
-        
-        # Extract relevant weather information
-        weather_info = {
-            'temperature': round(weather_data['main']['temp']),
-            'condition': weather_data['weather'][0]['main'],
-            'description': weather_data['weather'][0]['description'],
-            'humidity': weather_data['main']['humidity'],
-            'wind_speed': round(weather_data['wind']['speed'])
-        }
-        
+        weather_data = orjson.loads(weather_response.content)
+
         # Generate outfit recommendation
         recommendation = get_outfit_recommendation(weather_data, preferences)
-        
+
         # Fetch outfit images from Unsplash
-        outfit_images = get_outfit_images(recommendation['outfit'])
-        
-        # Combine response
-        response = {
+        outfit_images = get_outfit_images(recommendation['outfit'], complete_image_future)
+
+        # Combine the response in a single flat literal and serialize it
+        # directly with orjson, skipping jsonify's per-value inspection pass
+        body = orjson.dumps({
             'location': location,
-            'weather': weather_info,
+            'weather': {
+                'temperature': round(weather_data['main']['temp']),
+                'condition': weather_data['weather'][0]['main'],
+                'description': weather_data['weather'][0]['description'],
+                'humidity': weather_data['main']['humidity'],
+                'wind_speed': round(weather_data['wind']['speed'])
+            },
             'outfit': recommendation['outfit'],
             'outfit_images': outfit_images,
             'color_palette': recommendation['color_palette'],
             'style_tips': recommendation['style_tips']
-        }
-        
-        return jsonify(response), 200
+        })
+        return app.response_class(body, mimetype='application/json'), 200
         
     except requests.RequestException as e:
         return jsonify({
@@ -281,6 +591,8 @@ def outfit_recommendation():
 
 
 if __name__ == '__main__':
-    # Use PORT from environment variable (Render provides this)
+    # Local development only; on Render the app runs under gunicorn with
+    # threaded workers (see Procfile) so requests can overlap their
+    # upstream API waits instead of queueing behind the dev server
     port = int(os.getenv('PORT', 5000))
     app.run(host='0.0.0.0', port=port, debug=False)
\ No newline at end of file